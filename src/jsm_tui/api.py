@@ -1,18 +1,38 @@
 from __future__ import annotations
 
 import logging
-from pprint import pformat
+import reprlib
 from datetime import UTC, datetime
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Any
 
 import httpx
 
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+    _orjson_dumps = None  # type: ignore[assignment]
+
 from .config import Settings
 from .models import Alert
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime.fromtimestamp(0, UTC)
+
+_ALERT_DETAILS_LOG = (
+    "Alert details id=%s priority=%s status=%s age=%s acked_by=%s tags=%s message=%s"
+)
+_ALERT_PAYLOAD_LOG = "Alert raw payload: %s"
+
+_PAYLOAD_REPR = reprlib.Repr()
+_PAYLOAD_REPR.maxstring = 500
+_PAYLOAD_REPR.maxdict = 20
+_PAYLOAD_REPR.maxlist = 20
+
 
 class ApiError(RuntimeError):
     pass
@@ -38,6 +58,12 @@ class JsmApiClient:
             timeout=20.0,
             headers=headers,
             auth=auth,
+            limits=httpx.Limits(
+                max_keepalive_connections=4,
+                max_connections=8,
+                keepalive_expiry=60.0,
+            ),
+            http2=True,
         )
         self._page_size = settings.page_size
         self._log_http_body = settings.log_http_body
@@ -56,23 +82,30 @@ class JsmApiClient:
 
         raw_alerts = _extract_alerts(payload)
         alerts: list[Alert] = []
-        for item in raw_alerts:
-            alert = Alert.from_api(item)
-            logger.info(
-                "Alert details id=%s priority=%s status=%s age=%s acked_by=%s tags=%s message=%s",
-                alert.id,
-                alert.priority,
-                alert.status,
-                alert.age,
-                alert.acknowledged_by,
-                alert.tags_display,
-                _truncate_text(alert.message, max_len=250),
-            )
-            logger.info("Alert raw payload: %s", _truncate_text(pformat(item), max_len=4000))
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        append = alerts.append
+        log_info = logger.info
+        log_debug = logger.debug
+        for item, alert in zip(raw_alerts, Alert.from_api_batch(raw_alerts), strict=True):
+            if info_enabled:
+                log_info(
+                    _ALERT_DETAILS_LOG,
+                    alert.id,
+                    alert.priority,
+                    alert.status,
+                    alert.age,
+                    alert.acknowledged_by,
+                    alert.tags_display,
+                    _truncate_text(alert.message, max_len=250),
+                )
+            if debug_enabled:
+                log_debug(_ALERT_PAYLOAD_LOG, _payload_preview(item, max_len=4000))
             if alert.id and alert.is_open:
-                alerts.append(alert)
+                append(alert)
 
-        return sorted(alerts, key=_sort_key, reverse=True)
+        alerts.sort(key=_sort_key, reverse=True)
+        return alerts
 
     def get_alert(self, alert_id: str) -> Alert:
         payload = self._request_json("GET", f"/v1/alerts/{alert_id}")
@@ -100,21 +133,23 @@ class JsmApiClient:
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        start = perf_counter()
-        logger.debug(
-            "JSM request %s %s (params=%s, json_keys=%s)",
-            method,
-            path,
-            _safe_params(params),
-            sorted(json.keys()) if json else None,
-        )
+        start = perf_counter_ns()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "JSM request %s %s (params=%s, json_keys=%s)",
+                method,
+                path,
+                _safe_params(params),
+                list(json.keys()) if json else None,
+            )
         try:
             response = self._client.request(method, path, params=params, json=json)
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
-            duration_ms = int((perf_counter() - start) * 1000)
-            message = _truncate_text(exc.response.text.strip())
-            error_body = message if self._log_http_body else "<hidden>"
+            duration_ms = (perf_counter_ns() - start) // 1_000_000
+            error_body = (
+                _truncate_text(exc.response.text.strip()) if self._log_http_body else "<hidden>"
+            )
             logger.error(
                 "JSM HTTP error %s %s status=%d duration_ms=%d body=%s",
                 method,
@@ -127,7 +162,7 @@ class JsmApiClient:
                 f"{method} {path} failed with {exc.response.status_code}: {error_body}"
             ) from exc
         except httpx.HTTPError as exc:
-            duration_ms = int((perf_counter() - start) * 1000)
+            duration_ms = (perf_counter_ns() - start) // 1_000_000
             logger.exception(
                 "JSM transport error %s %s duration_ms=%d",
                 method,
@@ -136,17 +171,17 @@ class JsmApiClient:
             )
             raise ApiError(f"{method} {path} failed: {exc}") from exc
 
-        duration_ms = int((perf_counter() - start) * 1000)
-        logger.info(
-            "JSM response %s %s status=%d duration_ms=%d",
-            method,
-            path,
-            response.status_code,
-            duration_ms,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "JSM response %s %s status=%d duration_ms=%d",
+                method,
+                path,
+                response.status_code,
+                (perf_counter_ns() - start) // 1_000_000,
+            )
 
         try:
-            data = response.json()
+            data = _decode_json(response.content)
         except ValueError as exc:
             logger.error(
                 "JSM non-JSON response %s %s status=%d body=%s",
@@ -169,6 +204,10 @@ class JsmApiClient:
         return data
 
 
+def _decode_json(content: bytes) -> Any:
+    return _json_loads(content)
+
+
 def _extract_alerts(payload: dict[str, Any]) -> list[dict[str, Any]]:
     for key in ("data", "values", "alerts"):
         raw = payload.get(key)
@@ -195,7 +234,7 @@ def _looks_like_alert(payload: dict[str, Any]) -> bool:
 
 
 def _sort_key(alert: Alert) -> datetime:
-    return alert.created_at or datetime.fromtimestamp(0, UTC)
+    return alert.created_at or _EPOCH
 
 
 def _safe_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
@@ -208,6 +247,16 @@ def _safe_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
     return redacted
 
 
+def _payload_preview(item: dict[str, Any], *, max_len: int) -> str:
+    if _orjson_dumps is None:
+        return _truncate_text(_PAYLOAD_REPR.repr(item), max_len=max_len)
+
+    encoded = _orjson_dumps(item, default=str)
+    if len(encoded) <= max_len:
+        return encoded.decode("utf-8")
+    return f"{encoded[:max_len].decode('utf-8', 'replace')}...<truncated>"
+
+
 def _truncate_text(message: str, max_len: int = 500) -> str:
     if len(message) <= max_len:
         return message
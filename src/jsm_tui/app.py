@@ -3,8 +3,10 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, replace
+from time import time
 from typing import ClassVar
 
+from rich.console import RenderableType
 from rich.text import Text
 from textual import work
 from textual.app import App, ComposeResult
@@ -18,6 +20,23 @@ from .models import Alert
 
 logger = logging.getLogger(__name__)
 
+# Normalized status -> (table cell style, details modal style id).
+_STATUS_STYLES = {
+    "acked": ("green", "detail-status-acked"),
+    "acknowledged": ("green", "detail-status-acked"),
+    "open": ("red", "detail-status-open"),
+}
+_OTHER_STATUS_STYLE = ("yellow", "detail-status-other")
+
+_COLUMNS = (
+    ("priority", "Prio"),
+    ("status", "Status"),
+    ("age", "Age"),
+    ("acked_by", "Acked By"),
+    ("tags", "Tags"),
+    ("message", "Message"),
+)
+
 
 @dataclass(slots=True)
 class AlertDescription:
@@ -238,6 +257,8 @@ class AlertsApp(App[None]):
         self._actor_email = actor_email
         self._alerts: dict[str, Alert] = {}
         self._row_ids: list[str] = []
+        # Plain row values as last rendered, used to diff refreshes against the table.
+        self._rendered_rows: dict[str, tuple[str, ...]] = {}
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -248,7 +269,8 @@ class AlertsApp(App[None]):
 
     def on_mount(self) -> None:
         table = self._table
-        table.add_columns("Prio", "Status", "Age", "Acked By", "Tags", "Message")
+        for key, label in _COLUMNS:
+            table.add_column(label, key=key)
         table.zebra_stripes = True
         self.action_refresh()
         self.set_interval(self._refresh_interval_seconds, self.action_refresh)
@@ -275,26 +297,50 @@ class AlertsApp(App[None]):
         self.call_from_thread(self._render_alerts, alerts)
 
     def _render_alerts(self, alerts: list[Alert]) -> None:
-        self._alerts = {alert.id: alert for alert in alerts}
-        self._row_ids = [alert.id for alert in alerts]
-        self._render_table_from_state()
+        alerts_by_id = {alert.id: alert for alert in alerts}
+        row_ids = [alert.id for alert in alerts]
+        kept_ids = [alert_id for alert_id in self._row_ids if alert_id in alerts_by_id]
+        removed_ids = [alert_id for alert_id in self._row_ids if alert_id not in alerts_by_id]
+        self._alerts = alerts_by_id
+        self._row_ids = row_ids
+
+        if row_ids != kept_ids:
+            self._render_table_from_state()
+            return
+
+        table = self._table
+        for alert_id in removed_ids:
+            table.remove_row(alert_id)
+            self._rendered_rows.pop(alert_id, None)
+        now = int(time())
+        for alert in alerts:
+            values = _row_values(alert, now)
+            if self._rendered_rows.get(alert.id) != values:
+                self._update_row(alert.id, values)
+        self._update_open_count()
 
     def _render_table_from_state(self) -> None:
+        # DataTable can only append rows, so any insertion or reordering rebuilds it here.
         table = self._table
         table.clear()
+        self._rendered_rows.clear()
+        now = int(time())
         for alert_id in self._row_ids:
             alert = self._alerts.get(alert_id)
             if not alert:
                 continue
-            table.add_row(
-                alert.priority,
-                _status_cell(alert.status),
-                alert.age,
-                alert.acknowledged_by,
-                _truncate_cell(alert.tags_display, max_len=10),
-                Text(alert.message),
-                key=alert.id,
-            )
+            values = _row_values(alert, now)
+            table.add_row(*_row_cells(values), key=alert.id)
+            self._rendered_rows[alert.id] = values
+        self._update_open_count()
+
+    def _update_row(self, alert_id: str, values: tuple[str, ...]) -> None:
+        table = self._table
+        for (column_key, _), value in zip(_COLUMNS, _row_cells(values), strict=True):
+            table.update_cell(alert_id, column_key, value, update_width=True)
+        self._rendered_rows[alert_id] = values
+
+    def _update_open_count(self) -> None:
         self.query_one("#open-alerts-count", Static).update(f"Open alerts: {len(self._row_ids)}")
 
     def action_acknowledge(self) -> None:
@@ -412,8 +458,11 @@ class AlertsApp(App[None]):
 
     def _optimistically_remove_alert(self, alert_id: str) -> None:
         self._alerts.pop(alert_id, None)
-        self._row_ids = [current for current in self._row_ids if current != alert_id]
-        self._render_table_from_state()
+        if alert_id in self._row_ids:
+            self._row_ids.remove(alert_id)
+            self._rendered_rows.pop(alert_id, None)
+            self._table.remove_row(alert_id)
+        self._update_open_count()
 
     def _optimistically_ack_alert(self, alert_id: str) -> None:
         alert = self._alerts.get(alert_id)
@@ -423,61 +472,87 @@ class AlertsApp(App[None]):
         alert.status = "acked"
         if self._actor_email:
             alert.acknowledged_by = self._actor_email
-        self._render_table_from_state()
+        self._update_row(alert_id, _row_values(alert))
 
     def _restore_alert(self, alert: Alert, index: int) -> None:
         self._alerts[alert.id] = alert
-        if alert.id not in self._row_ids:
-            insert_at = min(max(index, 0), len(self._row_ids))
-            self._row_ids.insert(insert_at, alert.id)
+        if alert.id in self._row_ids:
+            self._update_row(alert.id, _row_values(alert))
+            return
+
+        insert_at = min(max(index, 0), len(self._row_ids))
+        self._row_ids.insert(insert_at, alert.id)
         self._render_table_from_state()
 
 
+def _row_values(alert: Alert, now: int | None = None) -> tuple[str, ...]:
+    return (
+        alert.priority,
+        alert.status,
+        alert.age if now is None else alert.age_at(now),
+        alert.acknowledged_by,
+        alert.tags_display,
+        alert.message,
+    )
+
+
+def _row_cells(values: tuple[str, ...]) -> tuple[RenderableType, ...]:
+    priority, status, age, acknowledged_by, tags, message = values
+    return (
+        priority,
+        _status_cell(status),
+        age,
+        acknowledged_by,
+        _truncate_cell(tags, max_len=10),
+        Text(message),
+    )
+
+
+def _status_info(status: str) -> tuple[str, str]:
+    return _STATUS_STYLES.get(status.lower().strip(), _OTHER_STATUS_STYLE)
+
+
 def _status_cell(status: str) -> Text:
-    normalized = status.lower().strip()
-    if normalized in {"acked", "acknowledged"}:
-        style = "green"
-    elif normalized == "open":
-        style = "red"
-    else:
-        style = "yellow"
+    style, _ = _status_info(status)
     return Text(status, style=style)
 
 
 def _status_style_id(status: str) -> str:
-    normalized = status.lower().strip()
-    if normalized in {"acked", "acknowledged"}:
-        return "detail-status-acked"
-    if normalized == "open":
-        return "detail-status-open"
-    return "detail-status-other"
+    _, style_id = _status_info(status)
+    return style_id
 
 
 _URL_PATTERN = re.compile(r"(?<!\()(?P<url>https?://[^\s<>)]+)")
-_RUNBOOK_MARKDOWN_PATTERN = re.compile(
-    r"\[[^\]]*runbook[^\]]*\]\((?P<url>https?://[^)\s]+)\)", flags=re.IGNORECASE
-)
-_RUNBOOK_PLAIN_PATTERN = re.compile(
-    r"runbook\s*[:=-]?\s*(?P<url>https?://[^\s<>)]+)", flags=re.IGNORECASE
+# One pass finds markdown runbook links, "runbook: <url>" labels and bare URLs. The
+# label and bare URL branches are lookaheads so they never hide a later markdown link.
+_RUNBOOK_PATTERN = re.compile(
+    r"(?i:\[[^\]]*runbook[^\]]*\]\((?P<markdown>https?://[^)\s]+)\))"
+    r"|(?=(?i:runbook\s*[:=-]?\s*(?P<plain>https?://[^\s<>)]+)))"
+    r"|(?<!\()(?=(?P<url>https?://[^\s<>)]+))"
 )
+_URL_SUB = _URL_PATTERN.sub
+_RUNBOOK_FINDITER = _RUNBOOK_PATTERN.finditer
 
 
 def _linkify_urls(text: str) -> str:
-    return _URL_PATTERN.sub(r"[\g<url>](\g<url>)", text)
+    return _URL_SUB(r"[\g<url>](\g<url>)", text)
 
 
 def _extract_runbook_url(text: str) -> str | None:
-    markdown_match = _RUNBOOK_MARKDOWN_PATTERN.search(text)
-    if markdown_match:
-        return _clean_url(markdown_match.group("url"))
-
-    plain_match = _RUNBOOK_PLAIN_PATTERN.search(text)
-    if plain_match:
-        return _clean_url(plain_match.group("url"))
-
-    fallback = _URL_PATTERN.search(text)
-    if fallback:
-        return _clean_url(fallback.group("url"))
+    plain_url: str | None = None
+    fallback_url: str | None = None
+    for match in _RUNBOOK_FINDITER(text):
+        markdown_url = match.group("markdown")
+        if markdown_url:
+            return _clean_url(markdown_url)
+        if plain_url is None:
+            plain_url = match.group("plain")
+        if fallback_url is None:
+            fallback_url = match.group("url")
+
+    url = plain_url or fallback_url
+    if url:
+        return _clean_url(url)
 
     return None
 
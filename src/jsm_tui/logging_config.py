@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
 
 
-def configure_logging(level_name: str, log_file: str) -> None:
+def configure_logging(level_name: str, log_file: str) -> QueueListener:
     level = logging.getLevelNamesMapping().get(level_name.upper(), logging.INFO)
     log_path = Path(log_file).expanduser()
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -18,7 +19,12 @@ def configure_logging(level_name: str, log_file: str) -> None:
     )
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s"))
 
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+
     root = logging.getLogger()
     root.setLevel(level)
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener
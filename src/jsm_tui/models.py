@@ -1,9 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import UTC, datetime
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from time import time
 from typing import Any
 
+_CLOSED_STATUSES = frozenset({"closed", "resolved"})
+_ACKNOWLEDGED_BY_KEYS = (
+    "acknowledgedBy",
+    "acknowledged_by",
+    "acknowledgers",
+    "acknowledgedByUser",
+    "owner",
+)
+_NORMALIZED_CACHE_LIMIT = 64
+_PRIORITY_CACHE: dict[str, str] = {}
+_STATUS_CACHE: dict[str, str] = {}
+_PERSON_KEYS = ("fullName", "displayName", "name", "username", "email", "emailAddress")
+_TAG_KEYS = ("name", "label", "value", "key")
+
 
 @dataclass(slots=True)
 class Alert:
@@ -15,9 +33,16 @@ class Alert:
     created_at: datetime | None
     acknowledged_by: str
     tags: tuple[str, ...] = ()
+    created_at_epoch: int | None = field(init=False, default=None, repr=False, compare=False)
+    tags_display: str = field(init=False, default="-", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.created_at is not None:
+            self.created_at_epoch = int(self.created_at.timestamp())
+        self.tags_display = _format_tags(self.tags)
 
     @classmethod
-    def from_api(cls, payload: dict[str, Any]) -> Alert:
+    def from_api(cls, payload: Mapping[str, Any]) -> Alert:
         created_at = _parse_datetime(
             payload.get("createdAt")
             or payload.get("created_at")
@@ -25,22 +50,20 @@ class Alert:
             or payload.get("lastOccurredAt")
         )
 
-        acknowledged_by = _first_non_empty(
-            _person_name(payload.get("acknowledgedBy")),
-            _person_name(payload.get("acknowledged_by")),
-            _person_name(payload.get("acknowledgers")),
-            _person_name(payload.get("acknowledgedByUser")),
-            _owner_name(payload.get("owner")),
-        )
-        acknowledged_by = _format_acknowledged_by(acknowledged_by)
+        acknowledged_by = ""
+        for key in _ACKNOWLEDGED_BY_KEYS:
+            acknowledged_by = _person_name(payload.get(key))
+            if acknowledged_by:
+                break
+        acknowledged_by = acknowledged_by or "-"
 
         message = str(payload.get("message") or payload.get("alias") or "(no message)")
         description = str(payload.get("description") or payload.get("details") or message)
 
         return cls(
             id=str(payload.get("id") or payload.get("tinyId") or ""),
-            priority=str(payload.get("priority") or "unknown").upper(),
-            status=str(payload.get("status") or "unknown").lower(),
+            priority=_normalize_priority(str(payload.get("priority") or "unknown")),
+            status=_normalize_status(str(payload.get("status") or "unknown")),
             message=message,
             description=description,
             created_at=created_at,
@@ -48,13 +71,20 @@ class Alert:
             tags=_extract_tags(payload),
         )
 
+    @classmethod
+    def from_api_batch(cls, payloads: Iterable[Mapping[str, Any]]) -> list[Alert]:
+        from_api = cls.from_api
+        return [from_api(payload) for payload in payloads]
+
     @property
     def age(self) -> str:
-        if self.created_at is None:
+        return self.age_at(int(time()))
+
+    def age_at(self, now_epoch: int) -> str:
+        if self.created_at_epoch is None:
             return "-"
 
-        delta = datetime.now(UTC) - self.created_at.astimezone(UTC)
-        total_seconds = max(int(delta.total_seconds()), 0)
+        total_seconds = max(now_epoch - self.created_at_epoch, 0)
         days, remainder = divmod(total_seconds, 86400)
         hours, remainder = divmod(remainder, 3600)
         minutes, _ = divmod(remainder, 60)
@@ -67,62 +97,74 @@ class Alert:
 
     @property
     def is_open(self) -> bool:
-        return self.status not in {"closed", "resolved"}
+        return self.status not in _CLOSED_STATUSES
 
-    @property
-    def tags_display(self) -> str:
-        if not self.tags:
-            return "-"
-        return ", ".join(self.tags)
+
+def _normalize_priority(raw: str) -> str:
+    value = _PRIORITY_CACHE.get(raw)
+    if value is None:
+        value = sys.intern(raw.upper())
+        if len(_PRIORITY_CACHE) < _NORMALIZED_CACHE_LIMIT:
+            _PRIORITY_CACHE[raw] = value
+    return value
 
 
-def _first_non_empty(*values: object) -> str:
-    for value in values:
-        if value:
-            return str(value)
-    return "-"
+def _normalize_status(raw: str) -> str:
+    value = _STATUS_CACHE.get(raw)
+    if value is None:
+        value = sys.intern(raw.lower())
+        if len(_STATUS_CACHE) < _NORMALIZED_CACHE_LIMIT:
+            _STATUS_CACHE[raw] = value
+    return value
 
 
-def _owner_name(owner: object) -> str:
-    return _person_name(owner)
+def _format_tags(tags: tuple[str, ...]) -> str:
+    if not tags:
+        return "-"
+    return ", ".join(tags)
 
 
 def _person_name(value: object) -> str:
     if isinstance(value, str):
-        return value.strip()
+        if "," in value:
+            return _person_name(value.split(","))
+        return _localize(value)
 
     if isinstance(value, dict):
-        return _first_non_empty(
-            value.get("fullName"),
-            value.get("displayName"),
-            value.get("name"),
-            value.get("username"),
-            value.get("email"),
-            value.get("emailAddress"),
-        )
+        for key in _PERSON_KEYS:
+            candidate = value.get(key)
+            if candidate:
+                return _person_name(str(candidate)) or "-"
+        return "-"
 
     if isinstance(value, list):
-        names: list[str] = []
+        names: dict[str, None] = {}
         for item in value:
-            name = _person_name(item).strip()
-            if name and name != "-" and name not in names:
-                names.append(name)
+            name = _person_name(item)
+            if name and name != "-":
+                names[name] = None
         return ", ".join(names)
 
     return ""
 
 
-def _extract_tags(payload: dict[str, Any]) -> tuple[str, ...]:
-    tags: list[str] = []
-    for key in ("tags", "alertTags", "labels"):
-        raw = payload.get(key)
-        if isinstance(raw, list):
-            for item in raw:
-                tag = _tag_name(item)
-                if tag and tag not in tags:
-                    tags.append(tag)
-            if tags:
-                break
+def _localize(name: str) -> str:
+    name = name.strip()
+    if "@" in name:
+        return name.split("@", 1)[0].strip() or name
+    return name
+
+
+def _extract_tags(payload: Mapping[str, Any]) -> tuple[str, ...]:
+    raw = payload.get("tags") or payload.get("alertTags") or payload.get("labels")
+    if not isinstance(raw, list):
+        return ()
+
+    tags: dict[str, None] = {}
+    for item in raw:
+        tag = _tag_name(item)
+        if tag:
+            tags[tag] = None
     return tuple(tags)
 
 
@@ -131,7 +173,7 @@ def _tag_name(value: object) -> str:
         return value.strip()
 
     if isinstance(value, dict):
-        for key in ("name", "label", "value", "key"):
+        for key in _TAG_KEYS:
             candidate = value.get(key)
             if isinstance(candidate, str):
                 normalized = candidate.strip()
@@ -144,25 +186,18 @@ def _tag_name(value: object) -> str:
 def _parse_datetime(raw: object) -> datetime | None:
     if not raw or not isinstance(raw, str):
         return None
+    return _parse_timestamp(raw)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(raw: str) -> datetime | None:
+    # API returns RFC3339 timestamps.
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        pass
 
     try:
-        # API returns RFC3339 timestamps.
         return datetime.fromisoformat(raw.replace("Z", "+00:00"))
     except ValueError:
         return None
-
-
-def _format_acknowledged_by(value: str) -> str:
-    parts = [part.strip() for part in value.split(",")]
-    normalized: list[str] = []
-    for part in parts:
-        if not part:
-            continue
-        if "@" in part:
-            local_part = part.split("@", 1)[0].strip()
-            normalized.append(local_part or part)
-        else:
-            normalized.append(part)
-    if not normalized:
-        return "-"
-    return ", ".join(normalized)
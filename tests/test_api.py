@@ -5,7 +5,13 @@ import logging
 import httpx
 import pytest
 
-from jsm_tui.api import ApiError, JsmApiClient
+from jsm_tui.api import (
+    ApiError,
+    JsmApiClient,
+    _decode_json,
+    _extract_alerts,
+    _payload_preview,
+)
 from jsm_tui.config import Settings
 
 
@@ -98,3 +104,119 @@ def test_get_alert_accepts_wrapped_data_shape() -> None:
     assert alert.id == "alert-2"
     assert alert.message == "wrapped"
     client.close()
+
+
+def test_non_json_response_raises_api_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"<html>maintenance</html>", request=request)
+
+    transport = httpx.MockTransport(handler)
+    client = JsmApiClient(_settings())
+    original_client = client._client
+    client._client = httpx.Client(
+        base_url=client._client.base_url,
+        transport=transport,
+        timeout=5.0,
+        headers=client._client.headers,
+    )
+    original_client.close()
+
+    with pytest.raises(ApiError, match="non-JSON response"):
+        client.get_alert("alert-3")
+
+    client.close()
+
+
+def test_decode_json_accepts_utf8_bytes() -> None:
+    assert _decode_json('{"message": "caf\u00e9"}'.encode()) == {"message": "caf\u00e9"}
+
+
+def test_decode_json_rejects_invalid_payloads() -> None:
+    with pytest.raises(ValueError):
+        _decode_json(b"not json")
+
+
+def test_extract_alerts_skips_non_dict_items() -> None:
+    payload = {"data": [{"id": "a"}, "junk", None, {"id": "b"}]}
+
+    assert _extract_alerts(payload) == [{"id": "a"}, {"id": "b"}]
+
+
+def test_extract_alerts_returns_copy_of_well_formed_page() -> None:
+    raw = [{"id": "a"}, {"id": "b"}]
+
+    alerts = _extract_alerts({"values": raw})
+
+    assert alerts == raw
+    assert alerts is not raw
+
+
+def test_list_open_alerts_skips_payload_formatting_when_debug_disabled(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"data": [{"id": "alert-4", "status": "open", "message": "quiet"}]},
+            request=request,
+        )
+
+    def fail_format(_: object, *, max_len: int) -> str:
+        raise AssertionError("payload formatted while DEBUG is disabled")
+
+    transport = httpx.MockTransport(handler)
+    client = JsmApiClient(_settings())
+    original_client = client._client
+    client._client = httpx.Client(
+        base_url=client._client.base_url,
+        transport=transport,
+        timeout=5.0,
+        headers=client._client.headers,
+    )
+    original_client.close()
+    monkeypatch.setattr("jsm_tui.api._payload_preview", fail_format)
+    caplog.set_level(logging.INFO, logger="jsm_tui.api")
+
+    alerts = client.list_open_alerts()
+
+    assert [alert.id for alert in alerts] == ["alert-4"]
+    client.close()
+
+
+def test_payload_preview_truncates_long_payloads() -> None:
+    preview = _payload_preview({"message": "x" * 100}, max_len=20)
+
+    assert preview.endswith("...<truncated>")
+    assert len(preview) == 20 + len("...<truncated>")
+
+
+def test_list_open_alerts_returns_newest_open_alerts_first() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "data": [
+                    {"id": "old", "status": "open", "createdAt": "2024-01-01T00:00:00Z"},
+                    {"id": "undated", "status": "open"},
+                    {"id": "closed", "status": "closed", "createdAt": "2024-03-01T00:00:00Z"},
+                    {"id": "new", "status": "acked", "createdAt": "2024-02-01T00:00:00Z"},
+                ]
+            },
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    client = JsmApiClient(_settings())
+    original_client = client._client
+    client._client = httpx.Client(
+        base_url=client._client.base_url,
+        transport=transport,
+        timeout=5.0,
+        headers=client._client.headers,
+    )
+    original_client.close()
+
+    alerts = client.list_open_alerts()
+
+    assert [alert.id for alert in alerts] == ["new", "old", "undated"]
+    client.close()
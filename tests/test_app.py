@@ -1,4 +1,20 @@
-from jsm_tui.app import _extract_runbook_url, _linkify_urls, _status_cell, _truncate_cell
+import asyncio
+from typing import Any
+
+import pytest
+from textual.pilot import Pilot
+
+from jsm_tui.api import ApiError
+from jsm_tui.app import (
+    AlertsApp,
+    _extract_runbook_url,
+    _linkify_urls,
+    _row_values,
+    _status_cell,
+    _status_style_id,
+    _truncate_cell,
+)
+from jsm_tui.models import Alert
 
 
 def test_status_cell_uses_green_for_acked() -> None:
@@ -11,6 +27,17 @@ def test_status_cell_uses_red_for_open() -> None:
     assert cell.style == "red"
 
 
+def test_status_cell_uses_yellow_for_other_statuses() -> None:
+    cell = _status_cell("snoozed")
+    assert cell.style == "yellow"
+
+
+def test_status_style_id_normalizes_status() -> None:
+    assert _status_style_id(" Acknowledged ") == "detail-status-acked"
+    assert _status_style_id("OPEN") == "detail-status-open"
+    assert _status_style_id("closed") == "detail-status-other"
+
+
 def test_linkify_urls_wraps_bare_http_links() -> None:
     text = "See https://example.com/path?x=1 for details."
     expected = "See [https://example.com/path?x=1](https://example.com/path?x=1) for details."
@@ -32,9 +59,219 @@ def test_extract_runbook_url_from_plain_runbook_label() -> None:
     assert _extract_runbook_url(text) == "https://example.com/runbook"
 
 
+def test_extract_runbook_url_prefers_labels_over_earlier_bare_urls() -> None:
+    text = "Docs: https://example.com/docs then runbook = https://example.com/runbook"
+    assert _extract_runbook_url(text) == "https://example.com/runbook"
+
+
+def test_extract_runbook_url_falls_back_to_first_url() -> None:
+    text = "See [dashboard](https://example.com/dash) or https://example.com/docs, thanks"
+    assert _extract_runbook_url(text) == "https://example.com/docs"
+
+
+def test_extract_runbook_url_returns_none_without_urls() -> None:
+    assert _extract_runbook_url("No links here") is None
+
+
 def test_truncate_cell_keeps_short_values() -> None:
     assert _truncate_cell("prod", max_len=10) == "prod"
 
 
 def test_truncate_cell_limits_to_max_len() -> None:
     assert _truncate_cell("payments,prod", max_len=10) == "payment..."
+
+
+def _alert(alert_id: str, *, status: str = "open", acknowledged_by: str = "-") -> Alert:
+    return Alert(
+        id=alert_id,
+        priority="P1",
+        status=status,
+        message=f"message {alert_id}",
+        description="d",
+        created_at=None,
+        acknowledged_by=acknowledged_by,
+    )
+
+
+class _StubClient:
+    def __init__(self, page: list[Alert]) -> None:
+        self.page = page
+        self.fail_close = False
+
+    def list_open_alerts(self) -> list[Alert]:
+        return list(self.page)
+
+    def acknowledge_alert(self, alert_id: str) -> None:
+        pass
+
+    def close_alert(self, alert_id: str) -> None:
+        if self.fail_close:
+            raise ApiError(f"close {alert_id} failed")
+
+
+async def _refresh(app: AlertsApp, pilot: Pilot[None]) -> None:
+    app.action_refresh()
+    await _settle(app, pilot)
+
+
+async def _settle(app: AlertsApp, pilot: Pilot[None]) -> None:
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+def _track_table_calls(app: AlertsApp, monkeypatch: pytest.MonkeyPatch) -> list[tuple[Any, ...]]:
+    table = app._table
+    calls: list[tuple[Any, ...]] = []
+    for name in ("clear", "add_row", "remove_row", "update_cell"):
+        original = getattr(table, name)
+
+        def tracked(*args: Any, _name: str = name, _original: Any = original, **kwargs: Any) -> Any:
+            calls.append((_name, *args))
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(table, name, tracked)
+    return calls
+
+
+def _row_keys(app: AlertsApp) -> list[str | None]:
+    return [row.key.value for row in app._table.ordered_rows]
+
+
+def _run(client: _StubClient, scenario: Any, *, actor_email: str | None = None) -> None:
+    async def main() -> None:
+        app = AlertsApp(
+            client,  # type: ignore[arg-type]
+            refresh_interval_seconds=3600,
+            actor_email=actor_email,
+        )
+        async with app.run_test() as pilot:
+            await _settle(app, pilot)
+            await scenario(app, pilot)
+
+    asyncio.run(main())
+
+
+def test_refresh_with_identical_page_leaves_rows_untouched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _StubClient([_alert("a"), _alert("b")])
+
+    async def scenario(app: AlertsApp, pilot: Pilot[None]) -> None:
+        calls = _track_table_calls(app, monkeypatch)
+        client.page = [_alert("a"), _alert("b")]
+
+        await _refresh(app, pilot)
+
+        assert calls == []
+        assert _row_keys(app) == ["a", "b"]
+
+    _run(client, scenario)
+
+
+def test_refresh_removes_dropped_alert_row(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _StubClient([_alert("a"), _alert("b"), _alert("c")])
+
+    async def scenario(app: AlertsApp, pilot: Pilot[None]) -> None:
+        calls = _track_table_calls(app, monkeypatch)
+        client.page = [_alert("a"), _alert("c")]
+
+        await _refresh(app, pilot)
+
+        assert calls == [("remove_row", "b")]
+        assert _row_keys(app) == ["a", "c"]
+        assert app._row_ids == ["a", "c"]
+        assert set(app._rendered_rows) == {"a", "c"}
+
+    _run(client, scenario)
+
+
+def test_refresh_updates_changed_status_in_place(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _StubClient([_alert("a"), _alert("b")])
+
+    async def scenario(app: AlertsApp, pilot: Pilot[None]) -> None:
+        calls = _track_table_calls(app, monkeypatch)
+        client.page = [_alert("a"), _alert("b", status="acked")]
+
+        await _refresh(app, pilot)
+
+        assert {call[0] for call in calls} == {"update_cell"}
+        assert {call[1] for call in calls} == {"b"}
+        assert str(app._table.get_cell("b", "status")) == "acked"
+        assert _row_keys(app) == ["a", "b"]
+
+    _run(client, scenario)
+
+
+def test_refresh_widens_column_for_longer_cell_values() -> None:
+    client = _StubClient([_alert("a"), _alert("b")])
+
+    async def scenario(app: AlertsApp, pilot: Pilot[None]) -> None:
+        column = app._table.columns["acked_by"]
+        width_before = column.content_width
+        client.page = [_alert("a"), _alert("b", acknowledged_by="Jane Oncall Longname")]
+
+        await _refresh(app, pilot)
+
+        assert column.content_width > width_before
+        assert column.content_width >= len("Jane Oncall Longname")
+
+    _run(client, scenario)
+
+
+@pytest.mark.parametrize(
+    "next_page",
+    [["new", "a", "b"], ["b", "a"]],
+    ids=["new-alert", "reordered"],
+)
+def test_refresh_rebuilds_table_for_new_or_reordered_alerts(
+    monkeypatch: pytest.MonkeyPatch, next_page: list[str]
+) -> None:
+    client = _StubClient([_alert("a"), _alert("b")])
+
+    async def scenario(app: AlertsApp, pilot: Pilot[None]) -> None:
+        calls = _track_table_calls(app, monkeypatch)
+        client.page = [_alert(alert_id) for alert_id in next_page]
+
+        await _refresh(app, pilot)
+
+        assert calls[0] == ("clear",)
+        assert [call[0] for call in calls[1:]] == ["add_row"] * len(next_page)
+        assert _row_keys(app) == next_page
+
+    _run(client, scenario)
+
+
+def test_acknowledge_shows_full_actor_email() -> None:
+    client = _StubClient([_alert("a"), _alert("b")])
+
+    async def scenario(app: AlertsApp, pilot: Pilot[None]) -> None:
+        app._table.move_cursor(row=1)
+        await pilot.pause()
+
+        await pilot.press("a")
+        await _settle(app, pilot)
+
+        assert str(app._table.get_cell("b", "status")) == "acked"
+        assert app._table.get_cell("b", "acked_by") == "jane.doe@example.com"
+        assert app._table.columns["acked_by"].content_width >= len("jane.doe@example.com")
+        assert app._rendered_rows["b"] == _row_values(app._alerts["b"])
+
+    _run(client, scenario, actor_email="jane.doe@example.com")
+
+
+def test_failed_close_restores_row_at_previous_index() -> None:
+    client = _StubClient([_alert("a"), _alert("b"), _alert("c")])
+
+    async def scenario(app: AlertsApp, pilot: Pilot[None]) -> None:
+        client.fail_close = True
+        app._table.move_cursor(row=1)
+        await pilot.pause()
+
+        await pilot.press("c")
+        await _settle(app, pilot)
+
+        assert _row_keys(app) == ["a", "b", "c"]
+        assert app._row_ids == ["a", "b", "c"]
+        assert set(app._alerts) == {"a", "b", "c"}
+
+    _run(client, scenario)
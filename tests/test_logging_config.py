@@ -0,0 +1,24 @@
+import logging
+from pathlib import Path
+
+from jsm_tui.logging_config import configure_logging
+
+
+def test_configure_logging_writes_records_through_queue(tmp_path: Path) -> None:
+    root = logging.getLogger()
+    previous_handlers = root.handlers[:]
+    previous_level = root.level
+    log_file = tmp_path / "logs" / "jsm-tui.log"
+
+    listener = configure_logging("info", str(log_file))
+    try:
+        logging.getLogger("jsm_tui.test").info("queued record")
+        logging.getLogger("jsm_tui.test").debug("filtered record")
+    finally:
+        listener.stop()
+        root.handlers[:] = previous_handlers
+        root.setLevel(previous_level)
+
+    content = log_file.read_text(encoding="utf-8")
+    assert "INFO jsm_tui.test - queued record" in content
+    assert "filtered record" not in content
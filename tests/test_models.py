@@ -1,6 +1,6 @@
 from datetime import UTC, datetime, timedelta
 
-from jsm_tui.models import Alert
+from jsm_tui.models import Alert, _parse_datetime
 
 
 def test_alert_from_api_parses_core_fields() -> None:
@@ -64,6 +64,25 @@ def test_age_formats_days_hours_minutes() -> None:
     assert minute_alert.age.endswith("m")
 
 
+def test_age_at_uses_given_reference_time() -> None:
+    now = datetime(2024, 5, 6, 12, 0, tzinfo=UTC)
+    now_epoch = int(now.timestamp())
+    alert = Alert(
+        id="1",
+        priority="P1",
+        status="open",
+        message="m",
+        description="d",
+        created_at=now - timedelta(minutes=59, seconds=59),
+        acknowledged_by="-",
+    )
+
+    assert alert.created_at_epoch == now_epoch - 3599
+    assert alert.age_at(now_epoch) == "59m"
+    assert alert.age_at(now_epoch + 1) == "1h"
+    assert alert.age_at(now_epoch - 3600) == "0m"
+
+
 def test_alert_from_api_parses_acknowledged_by_dict() -> None:
     payload = {
         "id": "abc123",
@@ -93,6 +112,39 @@ def test_alert_from_api_parses_acknowledged_by_list() -> None:
     assert alert.acknowledged_by == "Jane Oncall, sre"
 
 
+def test_alert_from_api_localizes_comma_separated_acknowledgers() -> None:
+    payload = {
+        "id": "abc123",
+        "status": "acknowledged",
+        "message": "Database unreachable",
+        "acknowledgedBy": "jane@example.com, sre@example.com",
+    }
+
+    alert = Alert.from_api(payload)
+
+    assert alert.acknowledged_by == "jane, sre"
+
+
+def test_alert_from_api_falls_back_to_owner_for_acknowledged_by() -> None:
+    payload = {
+        "id": "abc123",
+        "status": "acknowledged",
+        "message": "Database unreachable",
+        "acknowledgedBy": "",
+        "owner": {"displayName": "Owner Person"},
+    }
+
+    alert = Alert.from_api(payload)
+
+    assert alert.acknowledged_by == "Owner Person"
+
+
+def test_alert_from_api_without_acknowledger_uses_dash() -> None:
+    alert = Alert.from_api({"id": "abc123", "status": "open", "message": "m"})
+
+    assert alert.acknowledged_by == "-"
+
+
 def test_alert_from_api_parses_tags_from_list_of_strings() -> None:
     payload = {
         "id": "abc123",
@@ -125,3 +177,37 @@ def test_alert_from_api_parses_tags_from_dicts_and_deduplicates() -> None:
 
     assert alert.tags == ("payments", "p1", "backend")
 
+
+def test_parse_datetime_handles_utc_timestamps() -> None:
+    assert _parse_datetime("2024-05-06T07:08:09Z") == datetime(2024, 5, 6, 7, 8, 9, tzinfo=UTC)
+    assert _parse_datetime("2024-05-06T07:08:09.123Z") == datetime(
+        2024, 5, 6, 7, 8, 9, 123000, tzinfo=UTC
+    )
+
+
+def test_parse_datetime_falls_back_for_offsets_and_rejects_garbage() -> None:
+    parsed = _parse_datetime("2024-05-06T09:08:09+02:00")
+
+    assert parsed == datetime(2024, 5, 6, 7, 8, 9, tzinfo=UTC)
+    assert _parse_datetime("2024-05- 6T07:08:09Z") is None
+    assert _parse_datetime("not a timestamp") is None
+
+
+def test_alert_from_api_batch_preserves_order() -> None:
+    alerts = Alert.from_api_batch(
+        [
+            {"id": "a", "status": "open", "message": "first"},
+            {"id": "b", "status": "acked", "message": "second"},
+        ]
+    )
+
+    assert [(alert.id, alert.message) for alert in alerts] == [("a", "first"), ("b", "second")]
+
+
+def test_alert_from_api_normalizes_priority_and_status_case() -> None:
+    first = Alert.from_api({"id": "a", "priority": "p2", "status": "OPEN"})
+    second = Alert.from_api({"id": "b", "priority": "p2", "status": "OPEN"})
+
+    assert (first.priority, first.status) == ("P2", "open")
+    assert first.priority is second.priority
+    assert first.status is second.status